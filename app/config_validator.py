@@ -8,22 +8,157 @@ This module provides centralized configuration validation that can be used by:
 - Tests and other utilities
 """
 
+import functools
 import os
 import re
-import aiohttp
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+import string
+import sys
+import orjson
+from typing import TYPE_CHECKING, Callable, Dict, Final, List, Tuple, Optional
+from dataclasses import dataclass, field
 
-@dataclass
+# asyncio and aiohttp are only needed for the connectivity probe; import them lazily
+if TYPE_CHECKING:
+    import asyncio
+    import aiohttp
+
+# Optional: Aho-Corasick keyword matching (falls back to a compiled regex)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Slack API constants
+_APP_TOKEN_PREFIX: Final = 'xapp-'
+_BOT_TOKEN_PREFIX: Final = 'xoxb-'
+_TEAM_ID_PREFIX: Final = 'T'
+_SLACK_CONN_URL: Final = 'https://slack.com/api/apps.connections.open'
+_PROBE_TIMEOUT: Final = 10  # seconds
+
+# Slack channel IDs: C (public), D (direct message) or G (private/group),
+# followed by at least 8 uppercase alphanumerics
+_CHANNEL_ID_PREFIXES: Final = ('C', 'D', 'G')
+# Translation table deleting every allowed character; anything left over is invalid
+_CHANNEL_ID_STRIP: Final = str.maketrans('', '', string.ascii_uppercase + string.digits)
+
+def _is_valid_channel_id(channel_id: str) -> bool:
+    """Check channel ID format without going through the regex engine"""
+    return (len(channel_id) >= 9
+            and channel_id.startswith(_CHANNEL_ID_PREFIXES)
+            and not channel_id[1:].translate(_CHANNEL_ID_STRIP))
+
+# Required credentials: (attribute, env var, expected prefix, prefix mismatch is an error)
+_TOKEN_RULES: Final = (
+    ('app_token', 'SLACK_APP_TOKEN', _APP_TOKEN_PREFIX, True),
+    ('bot_token', 'SLACK_BOT_TOKEN', _BOT_TOKEN_PREFIX, True),
+    ('team_id', 'SLACK_TEAM_ID', _TEAM_ID_PREFIX, False),
+)
+REQUIRED_ENV_VARS: Final = tuple(name for _, name, _, _ in _TOKEN_RULES)
+
+_DEFAULT_KAGENT_A2A_URL: Final = 'http://kagent.kagent.svc.cluster.local:8083/api/a2a'
+_DEFAULT_BOT_KEYWORDS: Final[Tuple[str, ...]] = ('@bot', '@kagent', 'hey bot', 'hey kagent')
+
+# Parsed integer environment variables, cleared by ConfigValidator.reload()
+_INT_ENV_CACHE: Dict[str, int] = {}
+
+def _getenv_int(name: str, default: str) -> int:
+    """Read and parse an integer environment variable once per process"""
+    value = _INT_ENV_CACHE.get(name)
+    if value is None:
+        value = _INT_ENV_CACHE[name] = int(os.environ.get(name, default))
+    return value
+
+def _split_csv(value: str) -> List[str]:
+    """Split a comma-separated string into stripped, non-empty items"""
+    items = []
+    start = 0
+    while True:
+        end = value.find(',', start)
+        item = value[start:] if end == -1 else value[start:end]
+        item = item.strip()
+        if item:
+            items.append(item)
+        if end == -1:
+            return items
+        start = end + 1
+
+# Shared HTTP session for connectivity probes, created lazily on first use
+# (sessions are bound to their event loop, so the loop is remembered alongside it)
+_session: Optional['aiohttp.ClientSession'] = None
+_session_loop: Optional['asyncio.AbstractEventLoop'] = None
+_probe_headers: Dict[str, str] = {'Content-Type': 'application/json'}
+_probe_token: Optional[str] = None
+
+async def _get_session() -> 'aiohttp.ClientSession':
+    """Return the shared probe session, creating it if needed"""
+    global _session, _session_loop
+    import asyncio
+    
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        import aiohttp
+        
+        _session_loop = loop
+        _session = aiohttp.ClientSession(
+            # Keep one warm connection to slack.com so repeated probes skip the TLS handshake
+            connector=aiohttp.TCPConnector(
+                limit=2,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=_PROBE_TIMEOUT)
+        )
+    return _session
+
+async def close_session():
+    """Close the shared probe session (call on shutdown)"""
+    global _session, _session_loop
+    if _session is not None:
+        await _session.close()
+        _session = None
+        _session_loop = None
+
+def _build_keyword_matcher(keywords: Tuple[str, ...]) -> Callable[[str], bool]:
+    """Build a single-pass, case-insensitive matcher for any of the keywords"""
+    if not keywords:
+        return lambda text: False
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword.lower(), keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text.lower()), None) is not None
+    
+    pattern = re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+    return lambda text: pattern.search(text) is not None
+
+@dataclass(frozen=True, slots=True)
 class SlackConfig:
-    """Slack bot configuration data class"""
+    """Slack bot configuration data class (immutable, so it can be hashed and cached)
+    
+    bot_keywords are stored lowercased and de-duplicated.
+    """
     app_token: str
     bot_token: str
     team_id: str
-    channel_ids: List[str]
-    bot_keywords: List[str]
+    channel_ids: Tuple[str, ...]
+    bot_keywords: Tuple[str, ...]
     kagent_a2a_url: str
     kagent_a2a_timeout: int
+    _matcher: Callable[[str], bool] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_matcher', _build_keyword_matcher(self.bot_keywords))
+    
+    def matches(self, text: str) -> bool:
+        """Check whether text contains any of the bot keywords (case-insensitive)"""
+        return self._matcher(text)
+
+def _join_messages(messages: Tuple[str, ...]) -> str:
+    """Join validation messages, skipping the join for a single message"""
+    return messages[0] if len(messages) == 1 else '; '.join(messages)
 
 class ConfigError(Exception):
     """Configuration validation error"""
@@ -33,8 +168,13 @@ class ConfigValidator:
     """Centralized configuration validation"""
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def load_from_env() -> SlackConfig:
-        """Load configuration from environment variables"""
+        """
+        Load configuration from environment variables
+        
+        The environment is read once per process; use reload() to pick up changes.
+        """
         # Load basic config
         app_token = os.getenv('SLACK_APP_TOKEN', '')
         bot_token = os.getenv('SLACK_BOT_TOKEN', '')
@@ -42,106 +182,130 @@ class ConfigValidator:
         channel_ids_str = os.getenv('SLACK_CHANNEL_IDS', '')
         
         # Parse channel IDs
-        channel_ids = [ch.strip() for ch in channel_ids_str.split(',') if ch.strip()]
+        channel_ids = _split_csv(channel_ids_str)
         
-        # Load bot keywords
-        bot_keywords_str = os.getenv('BOT_KEYWORDS', '@bot,@kagent,hey bot,hey kagent')
-        bot_keywords = [keyword.strip() for keyword in bot_keywords_str.split(',') if keyword.strip()]
+        # Load bot keywords (the default is pre-normalized; only parse when overridden)
+        bot_keywords_str = os.environ.get('BOT_KEYWORDS')
+        if bot_keywords_str is None:
+            bot_keywords = _DEFAULT_BOT_KEYWORDS
+        else:
+            # Keywords are matched case-insensitively, so lowercase, intern and de-duplicate them once here
+            bot_keywords = tuple(dict.fromkeys(sys.intern(keyword.lower()) for keyword in _split_csv(bot_keywords_str)))
         
         # Load kagent config
-        kagent_a2a_url = os.getenv('KAGENT_A2A_URL', 'http://kagent.kagent.svc.cluster.local:8083/api/a2a')
-        kagent_a2a_timeout = int(os.getenv('KAGENT_A2A_TIMEOUT', '30'))
+        kagent_a2a_url = os.getenv('KAGENT_A2A_URL', _DEFAULT_KAGENT_A2A_URL)
+        kagent_a2a_timeout = _getenv_int('KAGENT_A2A_TIMEOUT', '30')
         
         return SlackConfig(
             app_token=app_token,
             bot_token=bot_token,
             team_id=team_id,
-            channel_ids=channel_ids,
+            channel_ids=tuple(channel_ids),
             bot_keywords=bot_keywords,
             kagent_a2a_url=kagent_a2a_url,
             kagent_a2a_timeout=kagent_a2a_timeout
         )
     
+    @classmethod
+    def reload(cls) -> SlackConfig:
+        """Drop the cached configuration and re-read the environment"""
+        cls.load_from_env.cache_clear()
+        _INT_ENV_CACHE.clear()
+        return cls.load_from_env()
+    
     @staticmethod
-    def validate_config(config: SlackConfig, strict: bool = True) -> Tuple[List[str], List[str]]:
+    @functools.lru_cache(maxsize=4)
+    def validate_config(config: SlackConfig, strict: bool = True) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
         """
         Validate configuration and return (errors, warnings)
         
+        Results are memoized per config instance since SlackConfig is immutable.
+        
         Args:
             config: Configuration to validate
-            strict: If True, treat warnings as errors
+            strict: If True, treat warnings as errors and return as soon as
+                    a required credential fails validation
             
         Returns:
             Tuple of (errors, warnings)
         """
-        errors = []
-        warnings = []
+        errors: List[str] = []
+        warnings: List[str] = []
+        add_error = errors.append
+        add_warning = warnings.append
         
         # Validate required fields
-        if not config.app_token:
-            errors.append("SLACK_APP_TOKEN is required")
-        elif not config.app_token.startswith('xapp-'):
-            errors.append(f"SLACK_APP_TOKEN must start with 'xapp-' (got: {config.app_token[:12]}...)")
-        
-        if not config.bot_token:
-            errors.append("SLACK_BOT_TOKEN is required")
-        elif not config.bot_token.startswith('xoxb-'):
-            errors.append(f"SLACK_BOT_TOKEN must start with 'xoxb-' (got: {config.bot_token[:12]}...)")
+        for attr, name, prefix, hard in _TOKEN_RULES:
+            value = getattr(config, attr)
+            if not value:
+                add_error(f"{name} is required")
+            elif not value.startswith(prefix):
+                if hard:
+                    add_error(f"{name} must start with {prefix!r} (got: {value[:12]}...)")
+                else:
+                    add_warning(f"{name} should start with {prefix!r} (got: {value})")
         
-        if not config.team_id:
-            errors.append("SLACK_TEAM_ID is required")
-        elif not config.team_id.startswith('T'):
-            warnings.append(f"SLACK_TEAM_ID should start with 'T' (got: {config.team_id})")
+        # Strict callers will reject the config anyway; skip the remaining checks
+        if errors and strict:
+            return tuple(errors), tuple(warnings)
         
         # Validate bot keywords
         if not config.bot_keywords:
-            errors.append("BOT_KEYWORDS cannot be empty")
+            add_error("BOT_KEYWORDS cannot be empty")
         
         # Validate channel IDs format
         for channel_id in config.channel_ids:
-            if not re.match(r'^[CDG][A-Z0-9]{8,}$', channel_id):
-                warnings.append(f"Channel ID format might be invalid: {channel_id}")
+            if not _is_valid_channel_id(channel_id):
+                add_warning(f"Channel ID format might be invalid: {channel_id}")
         
         # Validate kagent configuration
         if not config.kagent_a2a_url:
-            warnings.append("KAGENT_A2A_URL is not set")
+            add_warning("KAGENT_A2A_URL is not set")
         
         if config.kagent_a2a_timeout <= 0:
-            warnings.append(f"KAGENT_A2A_TIMEOUT should be positive (got: {config.kagent_a2a_timeout})")
+            add_warning(f"KAGENT_A2A_TIMEOUT should be positive (got: {config.kagent_a2a_timeout})")
         
-        return errors, warnings
+        return tuple(errors), tuple(warnings)
     
     @staticmethod
-    async def test_slack_connectivity(config: SlackConfig) -> Tuple[bool, Optional[str]]:
+    async def test_slack_connectivity(config: SlackConfig,
+                                      session: Optional['aiohttp.ClientSession'] = None) -> Tuple[bool, Optional[str]]:
         """
         Test Slack API connectivity
         
+        Args:
+            config: Configuration to test
+            session: HTTP session to probe with; defaults to the module's shared probe session
+        
         Returns:
             Tuple of (success, error_message)
         """
-        if not config.app_token or not config.app_token.startswith('xapp-'):
+        global _probe_token
+        import asyncio
+        
+        if not config.app_token or not config.app_token.startswith(_APP_TOKEN_PREFIX):
             return False, "Invalid app token"
         
         try:
-            url = "https://slack.com/api/apps.connections.open"
-            headers = {
-                'Authorization': f'Bearer {config.app_token}',
-                'Content-Type': 'application/json'
-            }
+            if _probe_token != config.app_token:
+                _probe_headers['Authorization'] = f'Bearer {config.app_token}'
+                _probe_token = config.app_token
             
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, headers=headers) as response:
-                    result = await response.json()
-                    
-                    if result.get('ok'):
-                        return True, None
-                    else:
-                        error_code = result.get('error', 'unknown')
-                        return False, f"Slack API error: {error_code}"
+            if session is None:
+                session = await _get_session()
+            # Caller-provided sessions may have no overall timeout, so bound the probe here
+            async with asyncio.timeout(_PROBE_TIMEOUT):
+                async with session.post(_SLACK_CONN_URL, headers=_probe_headers) as response:
+                    result = orjson.loads(await response.read())
+                
+                if result.get('ok'):
+                    return True, None
+                else:
+                    error_code = result.get('error', 'unknown')
+                    return False, f"Slack API error: {error_code}"
                         
         except Exception as e:
-            return False, f"Connection test failed: {str(e)}"
+            return False, f"Connection test failed: {str(e) or repr(e)}"
     
     @staticmethod
     def validate_and_raise(config: SlackConfig, strict: bool = True):
@@ -157,11 +321,13 @@ class ConfigValidator:
         """
         errors, warnings = ConfigValidator.validate_config(config, strict)
         
+        if not errors and not (strict and warnings):
+            return
+        
         if errors:
-            raise ConfigError(f"Configuration errors: {'; '.join(errors)}")
+            raise ConfigError("Configuration errors: " + _join_messages(errors))
         
-        if strict and warnings:
-            raise ConfigError(f"Configuration warnings (strict mode): {'; '.join(warnings)}")
+        raise ConfigError("Configuration warnings (strict mode): " + _join_messages(warnings))
 
 def load_and_validate_config(strict: bool = True) -> SlackConfig:
     """
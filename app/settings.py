@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Process-level runtime settings for the Slack bot
+
+Startup knobs (health port, log level, validation cache and probe) are read
+from the environment once and shared as an immutable Settings object.
+Slack credentials and bot behaviour live in config_validator.SlackConfig.
+"""
+
+import functools
+import logging
+import os
+from dataclasses import dataclass
+from typing import Final
+
+_DEFAULT_VALIDATION_CACHE_PATH: Final = '/tmp/kagent-slackbot.validation.json'
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Runtime settings data class (immutable, resolved once per process)"""
+    health_port: int
+    log_level: int
+    validation_cache_path: str
+    validation_cache_ttl: int  # seconds, 0 disables the cache
+    validation_probe_timeout: float  # seconds
+
+@functools.cache
+def get_settings() -> Settings:
+    """Read runtime settings from the environment (cached for the process lifetime)"""
+    log_level_name = os.getenv('LOG_LEVEL', 'INFO').upper()
+
+    return Settings(
+        health_port=int(os.getenv('HEALTH_PORT', '8080')),
+        log_level=logging.getLevelNamesMapping().get(log_level_name, logging.INFO),
+        validation_cache_path=os.getenv('VALIDATION_CACHE_PATH', _DEFAULT_VALIDATION_CACHE_PATH),
+        validation_cache_ttl=int(os.getenv('VALIDATION_CACHE_TTL', '43200')),
+        validation_probe_timeout=float(os.getenv('VALIDATION_PROBE_TIMEOUT', '3.0'))
+    )